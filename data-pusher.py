@@ -5,37 +5,78 @@ Pushes random log data at 1000+ documents per second.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
 import random
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from elasticsearch import Elasticsearch, helpers
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import orjson
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+from elasticsearch.serializer import JsonSerializer
 # Removed es_client dependencies (part of curator)
 # Removed curator dependency - using direct Elasticsearch connection
 
 
+class OrjsonSerializer(JsonSerializer):
+    """JSON serializer backed by orjson's C encoder instead of stdlib json"""
+
+    def dumps(self, data):
+        return orjson.dumps(data)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
 class DataPusher:
-    def __init__(self, client, index_name, docs_per_second=1000, batch_size=500):
+    def __init__(self, client, index_name, docs_per_second=1000, batch_size=500, op_type='create',
+                 max_chunk_bytes=50 * 1024 * 1024):
         self.client = client
         self.index_name = index_name
         self.docs_per_second = docs_per_second
         self.batch_size = batch_size
+        self.max_chunk_bytes = max_chunk_bytes
+        # 'create' is required for data streams; 'index' saves a few bytes
+        # of action metadata per document on regular indices
+        self.op_type = op_type
+        # Constant bulk action line, encoded once; the target index is
+        # supplied per-request instead of per-action
+        self._action_line = orjson.dumps({op_type: {}}) + b'\n'
         self.logger = logging.getLogger(__name__)
         
-        # Log level templates for realistic log data
-        self.log_levels = ['INFO', 'DEBUG', 'WARN', 'ERROR', 'TRACE']
+        # Single RNG reused for all vectorized sampling
+        self.rng = np.random.default_rng()
+        # Dedicated instance for the scalar path: bound methods skip the
+        # module-level attribute lookup on every call
+        self._rand = random.Random()
+
+        # Log level templates for realistic log data. These values repeat in
+        # every document, so intern them: each doc then carries a pointer to
+        # the same string object instead of hashing/comparing fresh copies.
+        self.log_levels = tuple(sys.intern(s) for s in ('INFO', 'DEBUG', 'WARN', 'ERROR', 'TRACE'))
         self.log_level_weights = [40, 30, 15, 10, 5]
-        
-        # Service names for realistic microservice logs
-        self.services = [
-            'user-service', 'payment-service', 'inventory-service', 
+        # Precomputed cumulative distribution for inverse-CDF sampling:
+        # searchsorted against this is cheaper than rng.choice(p=...), which
+        # rebuilds its own CDF on every call
+        self.log_level_cum = np.cumsum(self.log_level_weights, dtype=np.float64)
+        self.log_level_cum /= self.log_level_cum[-1]
+
+        # Deployment environments
+        self.environments = tuple(sys.intern(s) for s in ('prod', 'staging', 'dev'))
+
+        # Service names for realistic microservice logs (dashes keep these
+        # out of CPython's automatic identifier interning)
+        self.services = tuple(sys.intern(s) for s in (
+            'user-service', 'payment-service', 'inventory-service',
             'notification-service', 'auth-service', 'catalog-service',
             'order-service', 'shipping-service', 'analytics-service'
-        ]
-        
+        ))
+
         # Sample log messages
         self.log_messages = [
             'Request processed successfully',
@@ -54,7 +95,11 @@ class DataPusher:
             'Queue size: {} items',
             'File upload completed: {} bytes'
         ]
-        
+        # Pre-split each template on its '{}' placeholders and pair it with
+        # the placeholder count: messages are then assembled with a plain
+        # str.join instead of running str.format's parser on every call
+        self.log_message_parts = [(tmpl.split('{}'), tmpl.count('{}')) for tmpl in self.log_messages]
+
         # Numeric field ranges for realistic metrics
         self.metrics_ranges = {
             'response_time_ms': (10, 5000),
@@ -64,177 +109,377 @@ class DataPusher:
             'error_count': (0, 50),
             'bytes_processed': (1024, 104857600)  # 1KB to 100MB
         }
+        # Flattened (name, min, max, is_integer) tuples so per-batch sampling
+        # avoids dict iteration and repeated substring checks
+        self.metrics_list = [
+            (metric, min_val, max_val, 'percent' in metric or 'count' in metric)
+            for metric, (min_val, max_val) in self.metrics_ranges.items()
+        ]
+
+    def _build_message(self, parts, placeholder_count):
+        """Assemble a log message from pre-split template parts.
+
+        parts is the template split on '{}', so the message is the literal
+        pieces interleaved with random placeholder values and joined once.
+        """
+        if placeholder_count == 0:
+            return parts[0]
+
+        _choice = self._rand.choice
+        _randint = self._rand.randint
+
+        pieces = [parts[0]]
+        for part in parts[1:]:
+            pieces.append(_choice([
+                str(_randint(1, 1000)),
+                f"user_{_randint(1000, 9999)}",
+                f"session_{_randint(10000, 99999)}",
+                f"{_randint(50, 95)}",
+                f"orders",
+                f"products",
+                f"{_randint(100, 10000)}"
+            ]))
+            pieces.append(part)
+        return ''.join(pieces)
+
+    def _build_error(self, service):
+        """Generate error details for ERROR level logs"""
+        return {
+            'type': self._rand.choice(['TimeoutException', 'ConnectionError', 'ValidationError', 'AuthError']),
+            'stack_trace': f"at {service}.handler.process() line {self._rand.randint(50, 500)}"
+        }
 
     def generate_document(self, timestamp=None):
         """Generate a single timeseries document with realistic log data"""
+        # Alias the bound RNG methods once per call; at ~15 draws per
+        # document the repeated module attribute lookups add up
+        _choice = self._rand.choice
+        _randint = self._rand.randint
+        _random = self._rand.random
+        _uniform = self._rand.uniform
+
         if timestamp is None:
             timestamp = datetime.utcnow()
-            
+
         # Add some randomness to timestamp (within last 5 minutes)
-        timestamp = timestamp - timedelta(seconds=random.randint(0, 300))
-        
-        service = random.choice(self.services)
-        level = random.choices(self.log_levels, weights=self.log_level_weights)[0]
-        
-        # Generate realistic log message
-        message_template = random.choice(self.log_messages)
-        if '{}' in message_template:
-            # Fill in placeholders with random values
-            placeholders = []
-            for _ in range(message_template.count('{}')):
-                placeholder = random.choice([
-                    str(random.randint(1, 1000)),
-                    f"user_{random.randint(1000, 9999)}",
-                    f"session_{random.randint(10000, 99999)}",
-                    f"{random.randint(50, 95)}",
-                    f"orders",
-                    f"products",
-                    f"{random.randint(100, 10000)}"
-                ])
-                placeholders.append(placeholder)
-            message = message_template.format(*placeholders)
-        else:
-            message = message_template
-            
+        timestamp = timestamp - timedelta(seconds=_randint(0, 300))
+
+        service = _choice(self.services)
+        level = self._rand.choices(self.log_levels, weights=self.log_level_weights)[0]
+
         # Generate metrics
         metrics = {}
-        for metric, (min_val, max_val) in self.metrics_ranges.items():
-            if random.random() < 0.7:  # 70% chance to include each metric
-                if 'percent' in metric or 'count' in metric:
-                    metrics[metric] = random.randint(min_val, max_val)
+        for metric, min_val, max_val, is_integer in self.metrics_list:
+            if _random() < 0.7:  # 70% chance to include each metric
+                if is_integer:
+                    metrics[metric] = _randint(min_val, max_val)
                 else:
-                    metrics[metric] = round(random.uniform(min_val, max_val), 2)
-        
+                    metrics[metric] = round(_uniform(min_val, max_val), 2)
+
         # Create the document
         doc = {
             '@timestamp': timestamp.isoformat() + 'Z',
             'service': service,
             'level': level,
-            'message': message,
-            'environment': random.choice(['prod', 'staging', 'dev']),
-            'host': f"host-{random.randint(1, 20):02d}",
-            'request_id': f"req_{random.randint(100000, 999999)}",
-            'user_id': random.randint(1000, 50000) if random.random() < 0.8 else None,
-            'session_id': f"sess_{random.randint(1000000, 9999999)}",
+            'message': self._build_message(*_choice(self.log_message_parts)),
+            'environment': _choice(self.environments),
+            'host': f"host-{_randint(1, 20):02d}",
+            'request_id': f"req_{_randint(100000, 999999)}",
+            'user_id': _randint(1000, 50000) if _random() < 0.8 else None,
+            'session_id': f"sess_{_randint(1000000, 9999999)}",
             **metrics
         }
-        
+
         # Add error details for ERROR level logs
         if level == 'ERROR':
-            doc['error'] = {
-                'type': random.choice(['TimeoutException', 'ConnectionError', 'ValidationError', 'AuthError']),
-                'stack_trace': f"at {service}.handler.process() line {random.randint(50, 500)}"
-            }
-            
+            doc['error'] = self._build_error(service)
+
         return doc
 
+    def _sample_metric_columns(self, n):
+        """Fill per-batch metric value and inclusion-mask arrays in one pass.
+
+        This is the numeric kernel of batch generation: one value array and
+        one 70%-inclusion mask per metric, computed by NumPy in C. Returns a
+        list of (metric, values, mask) tuples ready for dict assembly.
+        """
+        rng = self.rng
+        columns = []
+        for metric, min_val, max_val, is_integer in self.metrics_list:
+            if is_integer:
+                values = rng.integers(min_val, max_val, size=n, endpoint=True).tolist()
+            else:
+                values = np.round(rng.uniform(min_val, max_val, size=n), 2).tolist()
+            mask = (rng.random(n) < 0.7).tolist()
+            columns.append((metric, values, mask))
+        return columns
+
     def generate_batch(self, batch_size, timestamp=None):
-        """Generate a batch of documents"""
-        return [self.generate_document(timestamp) for _ in range(batch_size)]
-
-    def bulk_index_batch(self, documents):
-        """Index a batch of documents using bulk API"""
-        actions = []
-        for doc in documents:
-            action = {
-                '_index': self.index_name,
-                '_source': doc,
-                '_op_type': 'create'  # Required for data streams
+        """Generate a batch of documents with vectorized field sampling"""
+        if timestamp is None:
+            base_ts_ns = time.time_ns()
+        else:
+            base_ts_ns = int(timestamp.replace(tzinfo=timezone.utc).timestamp() * 1_000_000_000)
+
+        n = batch_size
+        rng = self.rng
+
+        # One vectorized timestamp pass per batch: random offsets within the
+        # last 5 minutes, ISO-formatted by numpy instead of allocating a
+        # datetime object and calling isoformat() per document
+        offsets_ns = rng.integers(0, 300_000_000_000, size=n)
+        ts_array = (base_ts_ns - offsets_ns).astype('datetime64[ns]').astype('datetime64[ms]')
+        timestamps = np.char.add(ts_array.astype(str), 'Z').tolist()
+
+        # One vectorized draw per field instead of ~15 random.* calls per doc.
+        # .tolist() converts to native Python ints/floats up front so the
+        # documents stay JSON-serializable.
+        service_idx = rng.integers(0, len(self.services), size=n).tolist()
+        level_idx = np.searchsorted(self.log_level_cum, rng.random(n)).tolist()
+        message_idx = rng.integers(0, len(self.log_messages), size=n).tolist()
+        env_idx = rng.integers(0, len(self.environments), size=n).tolist()
+        user_ids = rng.integers(1000, 50000, size=n, endpoint=True).tolist()
+        user_id_mask = (rng.random(n) < 0.8).tolist()
+
+        # Prefix whole integer columns at once with np.char instead of
+        # running an f-string per document
+        hosts = np.char.add(
+            'host-',
+            np.char.zfill(rng.integers(1, 20, size=n, endpoint=True).astype(str), 2)
+        ).tolist()
+        request_ids = np.char.add(
+            'req_', rng.integers(100000, 999999, size=n, endpoint=True).astype(str)
+        ).tolist()
+        session_ids = np.char.add(
+            'sess_', rng.integers(1000000, 9999999, size=n, endpoint=True).astype(str)
+        ).tolist()
+
+        metric_columns = self._sample_metric_columns(n)
+
+        docs = []
+        for i in range(n):
+            service = self.services[service_idx[i]]
+            level = self.log_levels[level_idx[i]]
+
+            doc = {
+                '@timestamp': timestamps[i],
+                'service': service,
+                'level': level,
+                'message': self._build_message(*self.log_message_parts[message_idx[i]]),
+                'environment': self.environments[env_idx[i]],
+                'host': hosts[i],
+                'request_id': request_ids[i],
+                'user_id': user_ids[i] if user_id_mask[i] else None,
+                'session_id': session_ids[i],
             }
-            actions.append(action)
-        
-        try:
-            # Use bulk with more detailed error handling
-            response = helpers.bulk(
-                self.client, 
-                actions, 
-                chunk_size=self.batch_size,
-                raise_on_error=False,
-                raise_on_exception=False
-            )
-            
-            success_count = response[0]
-            errors = response[1] if len(response) > 1 else []
-            
-            if errors:
+
+            for metric, values, mask in metric_columns:
+                if mask[i]:
+                    doc[metric] = values[i]
+
+            if level == 'ERROR':
+                doc['error'] = self._build_error(service)
+
+            docs.append(doc)
+
+        return docs
+
+    def _build_payload(self, docs):
+        """Serialize a batch of documents into one NDJSON bulk body.
+
+        The action line is constant for the pusher ({"create": {}}, with the
+        target index supplied once on the bulk call), so each document costs
+        one orjson.dumps plus the final join.
+        """
+        action_line = self._action_line
+        return b''.join(action_line + orjson.dumps(doc) + b'\n' for doc in docs)
+
+    def _tally_response(self, response, doc_count):
+        """Count indexed documents in a raw bulk response"""
+        if not response['errors']:
+            return doc_count
+
+        op_type = self.op_type
+        success = 0
+        failed = 0
+        for item in response['items']:
+            result = item.get(op_type, {})
+            if result.get('status', 500) < 300:
+                success += 1
+            else:
+                failed += 1
                 # Log first few errors for debugging
-                for i, error in enumerate(errors[:3]):
-                    self.logger.error(f"Document indexing error {i+1}: {error}")
-                self.logger.error(f"Bulk indexing failed: {len(errors)} document(s) failed to index.")
-            
-            return success_count
-            
-        except Exception as e:
-            self.logger.error(f"Bulk indexing exception: {e}")
-            return 0
+                if failed <= 3:
+                    self.logger.error(f"Document indexing error {failed}: {result}")
+        self.logger.error(f"Bulk indexing failed: {failed} document(s) failed to index.")
+        return success
+
+    def _bulk_raw(self, payload, doc_count):
+        """Send one pre-serialized bulk body, retrying with exponential backoff.
+
+        Returns the number of documents successfully indexed. The whole
+        request is retried on transport failure; helpers-style per-item
+        retry would rescan every response for the rare transient error.
+        """
+        backoff = 1.0
+        for attempt in range(4):
+            try:
+                response = self.client.bulk(operations=payload, index=self.index_name)
+            except Exception as e:
+                if attempt == 3:
+                    self.logger.error(f"Bulk indexing exception: {e}")
+                    return 0
+                self.logger.warning(f"Bulk request failed (attempt {attempt + 1}/4), retrying in {backoff:.0f}s: {e}")
+                time.sleep(backoff)
+                backoff *= 2
+            else:
+                return self._tally_response(response, doc_count)
+        return 0
+
+    async def _bulk_raw_async(self, payload, doc_count):
+        """Async variant of _bulk_raw"""
+        backoff = 1.0
+        for attempt in range(4):
+            try:
+                response = await self.client.bulk(operations=payload, index=self.index_name)
+            except Exception as e:
+                if attempt == 3:
+                    self.logger.error(f"Bulk indexing exception: {e}")
+                    return 0
+                self.logger.warning(f"Bulk request failed (attempt {attempt + 1}/4), retrying in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff *= 2
+            else:
+                return self._tally_response(response, doc_count)
+        return 0
+
+    def _calibrate_chunk_size(self):
+        """Derive the bulk chunk size from a measured average document size.
+
+        Optimal chunking is bounded by bytes, not document count:
+        chunk_size <= max_chunk_bytes / avg_doc_size. Measure the average
+        over a small sample batch so --batch-size can't produce chunks that
+        blow past max_chunk_bytes when documents grow.
+        """
+        samples = self.generate_batch(100)
+        avg_doc_size = sum(len(orjson.dumps(doc)) for doc in samples) / len(samples)
+        chunk_size = max(1, min(self.batch_size, int(self.max_chunk_bytes // avg_doc_size)))
+        self.logger.info(
+            f"Calibrated bulk chunk size: {chunk_size} docs "
+            f"(avg doc size {avg_doc_size:.0f} bytes, chunk cap {self.max_chunk_bytes} bytes)"
+        )
+        return chunk_size
 
     def push_data(self, duration_seconds=60, num_threads=4, infinite=False):
         """Push data for specified duration at target rate"""
+        self._log_start(duration_seconds, num_threads, infinite)
+        chunk_size = self._calibrate_chunk_size()
+
+        start_time = time.time()
+        end_time = start_time + duration_seconds if not infinite and duration_seconds > 0 else float('inf')
+        total_docs = 0
+
+        # Bulk requests are I/O bound but more threads than cores just adds contention
+        thread_count = min(num_threads, os.cpu_count() or num_threads)
+        # Pace on the actual chunk size so a byte-capped chunk still hits the rate
+        batch_interval = chunk_size / self.docs_per_second if self.docs_per_second > 0 else 0.1
+
+        # Same bounded in-flight scheme as the async path: acquire before
+        # submitting so generation stalls when ES falls behind
+        semaphore = threading.Semaphore(thread_count)
+        totals_lock = threading.Lock()
+
+        def index_payload(payload, doc_count):
+            nonlocal total_docs
+            try:
+                indexed = self._bulk_raw(payload, doc_count)
+                with totals_lock:
+                    total_docs += indexed
+            finally:
+                semaphore.release()
+
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            next_deadline = time.perf_counter() + batch_interval
+            while time.time() < end_time:
+                semaphore.acquire()
+                payload = self._build_payload(self.generate_batch(chunk_size))
+                executor.submit(index_payload, payload, chunk_size)
+
+                sleep_for = next_deadline - time.perf_counter()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                next_deadline += batch_interval
+            # Context exit waits for in-flight batches to drain
+
+        return self._report_results(start_time, total_docs)
+
+    async def push_data_async(self, duration_seconds=60, num_threads=4, infinite=False):
+        """Async variant of push_data using AsyncElasticsearch.
+
+        Schedules up to num_threads concurrent bulk requests on a single
+        event loop, avoiding per-batch thread wakeups and GIL handoffs.
+        Requires the client to be an AsyncElasticsearch instance.
+        """
+        self._log_start(duration_seconds, num_threads, infinite)
+        chunk_size = self._calibrate_chunk_size()
+
+        start_time = time.time()
+        end_time = start_time + duration_seconds if not infinite and duration_seconds > 0 else float('inf')
+        total_docs = 0
+
+        batch_interval = chunk_size / self.docs_per_second if self.docs_per_second > 0 else 0.1
+        semaphore = asyncio.Semaphore(num_threads)
+        in_flight = set()
+
+        async def index_payload(payload, doc_count):
+            nonlocal total_docs
+            try:
+                total_docs += await self._bulk_raw_async(payload, doc_count)
+            finally:
+                semaphore.release()
+
+        next_deadline = time.perf_counter() + batch_interval
+        while time.time() < end_time:
+            # Acquire before scheduling: this bounds in-flight requests to
+            # num_threads and stalls generation when ES falls behind, instead
+            # of queueing an ever-growing backlog of pending tasks
+            await semaphore.acquire()
+            payload = self._build_payload(self.generate_batch(chunk_size))
+            task = asyncio.create_task(index_payload(payload, chunk_size))
+            in_flight.add(task)
+            # Completed tasks drop out in O(1); only live batches are tracked
+            task.add_done_callback(in_flight.discard)
+
+            sleep_for = next_deadline - time.perf_counter()
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            next_deadline += batch_interval
+
+        # Wait for in-flight batches to drain
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+        return self._report_results(start_time, total_docs)
+
+    def _log_start(self, duration_seconds, num_threads, infinite):
+        """Log the run parameters at startup"""
         self.logger.info(f"Starting data push to index '{self.index_name}'")
         if infinite or duration_seconds == 0:
             self.logger.info(f"Target rate: {self.docs_per_second} docs/sec (infinite mode)")
         else:
             self.logger.info(f"Target rate: {self.docs_per_second} docs/sec for {duration_seconds} seconds")
         self.logger.info(f"Using {num_threads} threads with batch size {self.batch_size}")
-        
-        start_time = time.time()
-        end_time = start_time + duration_seconds if not infinite and duration_seconds > 0 else float('inf')
-        total_docs = 0
-        
-        # Calculate timing
-        batches_per_second = self.docs_per_second / self.batch_size
-        batch_interval = 1.0 / batches_per_second if batches_per_second > 0 else 0.1
-        
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = []
-            last_batch_time = start_time
-            
-            while time.time() < end_time:
-                current_time = time.time()
-                
-                # Submit batches to maintain target rate
-                if current_time - last_batch_time >= batch_interval:
-                    timestamp = datetime.utcnow()
-                    documents = self.generate_batch(self.batch_size, timestamp)
-                    
-                    future = executor.submit(self.bulk_index_batch, documents)
-                    futures.append(future)
-                    last_batch_time = current_time
-                
-                # Collect completed batches
-                completed_futures = []
-                for future in futures:
-                    if future.done():
-                        try:
-                            docs_indexed = future.result()
-                            total_docs += docs_indexed
-                        except Exception as e:
-                            self.logger.error(f"Batch failed: {e}")
-                        completed_futures.append(future)
-                
-                # Remove completed futures
-                for future in completed_futures:
-                    futures.remove(future)
-                
-                # Small sleep to prevent busy waiting
-                time.sleep(0.01)
-            
-            # Wait for remaining batches to complete
-            for future in as_completed(futures):
-                try:
-                    docs_indexed = future.result()
-                    total_docs += docs_indexed
-                except Exception as e:
-                    self.logger.error(f"Final batch failed: {e}")
-        
+
+    def _report_results(self, start_time, total_docs):
+        """Log the final throughput numbers and return (total_docs, rate)"""
         elapsed_time = time.time() - start_time
         actual_rate = total_docs / elapsed_time if elapsed_time > 0 else 0
-        
+
         self.logger.info(f"Indexing completed!")
         self.logger.info(f"Total documents indexed: {total_docs}")
         self.logger.info(f"Elapsed time: {elapsed_time:.2f} seconds")
         self.logger.info(f"Actual rate: {actual_rate:.1f} docs/sec")
-        
+
         return total_docs, actual_rate
 
 
@@ -248,17 +493,27 @@ def setup_logging(verbose=False):
     )
 
 
-def create_client(config_file=None, host='localhost:9200', username=None, password=None, verify_certs=True):
+def create_client(config_file=None, host='localhost:9200', username=None, password=None, verify_certs=True,
+                  use_async=False, num_threads=4):
     """Create Elasticsearch client using direct connection"""
     # Always use direct connection (curator dependency removed)
     if '://' not in host:
         host = f'http://{host}'
-    
+
     # Build connection parameters
     es_params = {
         'hosts': [host],
-        'request_timeout': 60,
-        'verify_certs': verify_certs
+        # Large bulks against a busy cluster can exceed the 60s default
+        'request_timeout': 120,
+        'verify_certs': verify_certs,
+        # Bulk payloads are serialized per-document; orjson is 3-10x faster
+        # than the stdlib encoder
+        'serializer': OrjsonSerializer(),
+        # Log JSON compresses 3-5x; gzip the bulk bodies on the wire
+        'http_compress': True,
+        # Default pool size makes concurrent bulk threads queue for
+        # connections; size the pool to the worker count
+        'connections_per_node': max(num_threads, 8)
     }
     
     # Add authentication if provided
@@ -272,8 +527,9 @@ def create_client(config_file=None, host='localhost:9200', username=None, passwo
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
         es_params['ssl_context'] = ssl_context
-    
-    return Elasticsearch(**es_params)
+
+    client_class = AsyncElasticsearch if use_async else Elasticsearch
+    return client_class(**es_params)
 
 
 def main():
@@ -319,11 +575,24 @@ Examples:
         help='Batch size for bulk indexing (default: 500)'
     )
     parser.add_argument(
-        '--threads', 
-        type=int, 
+        '--threads',
+        type=int,
         default=4,
         help='Number of worker threads (default: 4)'
     )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Use the async Elasticsearch client (event loop instead of worker threads)'
+    )
+    parser.add_argument(
+        '--op-type',
+        choices=['create', 'index'],
+        default='create',
+        help="Bulk operation type: 'create' is required for data streams, "
+             "'index' trims per-action metadata on regular indices (default: create)"
+    )
     parser.add_argument(
         '--config', 
         default=None,
@@ -368,29 +637,47 @@ Examples:
     try:
         # Create Elasticsearch client
         verify_certs = not args.no_verify_certs
-        client = create_client(None, args.host, args.username, args.password, verify_certs)
-        
-        # Test connection
-        info = client.info()
-        logger.info(f"Connected to Elasticsearch {info['version']['number']} at {info['cluster_name']}")
-        
+        client = create_client(None, args.host, args.username, args.password, verify_certs,
+                               use_async=args.use_async, num_threads=args.threads)
+
         # Create data pusher and start pushing
         pusher = DataPusher(
             client=client,
             index_name=args.index,
             docs_per_second=args.rate,
-            batch_size=args.batch_size
+            batch_size=args.batch_size,
+            op_type=args.op_type
         )
-        
+
         # Handle infinite mode (default is infinite with duration=0)
         infinite_mode = args.infinite or args.duration == 0
-        
-        total_docs, actual_rate = pusher.push_data(
-            duration_seconds=args.duration,
-            num_threads=args.threads,
-            infinite=infinite_mode
-        )
-        
+
+        if args.use_async:
+            async def run_async():
+                # Test connection
+                info = await client.info()
+                logger.info(f"Connected to Elasticsearch {info['version']['number']} at {info['cluster_name']}")
+                try:
+                    return await pusher.push_data_async(
+                        duration_seconds=args.duration,
+                        num_threads=args.threads,
+                        infinite=infinite_mode
+                    )
+                finally:
+                    await client.close()
+
+            total_docs, actual_rate = asyncio.run(run_async())
+        else:
+            # Test connection
+            info = client.info()
+            logger.info(f"Connected to Elasticsearch {info['version']['number']} at {info['cluster_name']}")
+
+            total_docs, actual_rate = pusher.push_data(
+                duration_seconds=args.duration,
+                num_threads=args.threads,
+                infinite=infinite_mode
+            )
+
         # Print summary
         print(f"\n=== Summary ===")
         print(f"Index: {args.index}")